@@ -1,19 +1,34 @@
 # Required imports 
 import os
+import sys
 import copy
+import math
 import time
 import logging
 import itertools
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Optional, Iterator
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from xml.sax.saxutils import escape, quoteattr
+from typing import Dict, List, Tuple, Optional, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Shared lxml parser (C-level parsing via libxml2); comments are dropped as with xml.etree
+_PARSER = ET.XMLParser(remove_blank_text=False, remove_comments=True, huge_tree=True, collect_ids=False)
+
+# Number of generated files between INFO progress messages
+_PROGRESS_INTERVAL = 50
+
+# Number of scenarios per process pool task
+_POOL_CHUNK_SIZE = 32
+
+# Short forms used in scenario names; other values fall back to "Basic" / "Mkt"
+_TECH_SHORT = {"Advanced": "Tech"}
+_ALLOC_SHORT = {"Regulatory": "Reg"}
 
 
 @dataclass
@@ -26,6 +41,14 @@ class ScenarioParameters:
     supply_capacities: List[str] = field(default_factory=lambda: ["Low", "Medium", "High"])
     allocation_regulations: List[str] = field(default_factory=lambda: ["Market-driven", "Regulatory"])
 
+    def __post_init__(self):
+        """Intern axis values so scenario names and lookup keys share string objects."""
+        self.ssps = [sys.intern(ssp) for ssp in self.ssps]
+        self.rcps = [sys.intern(rcp) for rcp in self.rcps]
+        self.technology_levels = [sys.intern(tech) for tech in self.technology_levels]
+        self.supply_capacities = [sys.intern(supply) for supply in self.supply_capacities]
+        self.allocation_regulations = [sys.intern(allocation) for allocation in self.allocation_regulations]
+
     def total_scenarios(self) -> int:
         """Calculate total number of scenario combinations."""
         return (len(self.ssps) * len(self.rcps) * len(self.pr_adoption_rates) * 
@@ -49,33 +72,28 @@ class SSPComponentExtractor:
     def extract_ssp_components(self, ssp: str) -> List[Tuple[str, str]]:
         """Extract components from specific SSP file using proper XML parsing."""
         ssp_file_path = os.path.join(self.ssp_files_directory, f"{ssp}_config.xml")
-        
-        if not os.path.exists(ssp_file_path):
-            logger.error(f"SSP file not found: {ssp_file_path}")
-            return []
 
         try:
-            tree = ET.parse(ssp_file_path)
-            root = tree.getroot()
-            
             components = []
             
-            # Extract all Value elements and their text content
-            for value_elem in root.findall(".//Value"):
-                name = value_elem.get("name")
-                path = value_elem.text
-                if name and path:
-                    components.append((name, path.strip()))
-            
-            # Extract comments that are direct children of FileSet
-            for elem in root:
-                if hasattr(elem, 'tag') and elem.tag is ET.Comment:
-                    comment_text = elem.text.strip()
-                    components.append((f"COMMENT_{comment_text.lower().replace(' ', '_').replace('-', '_')}", f"<!-- {comment_text} -->"))
+            # Stream Value elements without keeping the tree
+            for _, elem in ET.iterparse(ssp_file_path, events=("end",), remove_comments=True, huge_tree=True):
+                if elem.tag == "Value":
+                    name = elem.get("name")
+                    path = elem.text
+                    if name and path:
+                        components.append((name, path.strip()))
+                    # Release the element and already-processed siblings
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
             
             logger.info(f"Extracted {len(components)} components from {ssp}")
             return components
             
+        except FileNotFoundError:
+            logger.error(f"SSP file not found: {ssp_file_path}")
+            return []
         except ET.ParseError as e:
             logger.error(f"Failed to parse SSP file {ssp_file_path}: {e}")
             return []
@@ -83,30 +101,100 @@ class SSPComponentExtractor:
             logger.error(f"Failed to read SSP file {ssp_file_path}: {e}")
             return []
 
+    @lru_cache(maxsize=10)
+    def _ssp_components_bytes(self, ssp: str) -> bytes:
+        """Serialize SSP components once into the byte block spliced into ScenarioComponents."""
+        lines = []
+        for name, path in self.extract_ssp_components(ssp):
+            lines.append(f"<Value name={quoteattr(name)}>{escape(path)}</Value>")
+        return "".join(lines).encode("utf-8")
+
 # ──────────────────────────────────────────────────────────────────────────────
 # BASE TEMPLATE MANAGER CLASS
 # ──────────────────────────────────────────────────────────────────────────────
 
 class BaseTemplateManager:
     """Manage the base configuration template."""
+
+    # Per-scenario substitution points: (Value element path, template slot)
+    _SPLICE_POINTS = [
+        ("Strings/Value[@name='scenarioName']", "scenario_name"),
+        ("Files/Value[@name='policy-target-file']", "policy_target"),
+        ("Files/Value[@name='xmldb-location']", "xmldb_location"),
+    ]
     
-    def __init__(self, template_path: str = "configuration_reuse100.xml"):
+    def __init__(self, template_path: str = "configuration_reuse100.xml",
+                 ssps: Optional[List[str]] = None, rcps: Optional[List[str]] = None):
         self.template_path = template_path
         self.template_tree = self._load_template()
         self.template_root = self.template_tree.getroot()
 
+        # Policy target path per configured (SSP, RCP), built once from _get_spa_code
+        defaults = ScenarioParameters()
+        self._policy_paths = {
+            (ssp, rcp): self._format_policy_target(ssp, rcp)
+            for ssp in (defaults.ssps if ssps is None else ssps)
+            for rcp in (defaults.rcps if rcps is None else rcps)
+        }
+        self._document_template = self._build_document_template()
+
     def _load_template(self) -> ET.ElementTree:
         """Load and validate base template."""
         if not os.path.exists(self.template_path):
             raise FileNotFoundError(f"Base template not found: {self.template_path}")
         
         try:
-            tree = ET.parse(self.template_path)
+            tree = ET.parse(self.template_path, _PARSER)
             logger.info(f"Successfully loaded base template: {self.template_path}")
             return tree
         except ET.ParseError as e:
             raise ValueError(f"Invalid XML in template {self.template_path}: {e}")
 
+    def _build_document_template(self) -> bytes:
+        """Serialize template once into a bytes %-format template with one named slot per substitution."""
+        root = copy.deepcopy(self.template_root)
+
+        # Replace substituted values with placeholders so they can be located in the bytes;
+        # values missing from the template are left as they are
+        placeholders = {}
+        for path, slot in self._SPLICE_POINTS:
+            element = root.find(path)
+            if element is None:
+                logger.warning(f"{path} not found in template, {slot} will not be updated")
+                continue
+            element.text = f"{{{slot.upper()}}}"
+            placeholders[element.text.encode("utf-8")] = f"%({slot})b".encode("utf-8")
+
+        # SSP components are appended after the existing ScenarioComponents content
+        scenario_section = root.find("ScenarioComponents")
+        if scenario_section is None:
+            logger.warning("ScenarioComponents section not found in template")
+        else:
+            if len(scenario_section):
+                last_child = scenario_section[-1]
+                last_child.tail = (last_child.tail or "") + "{COMPONENTS}"
+            else:
+                scenario_section.text = (scenario_section.text or "") + "{COMPONENTS}"
+            placeholders[b"{COMPONENTS}"] = b"%(components)b"
+
+        # Escape literal '%' so only the slots are substituted
+        document = ET.tostring(root, encoding="utf-8").replace(b"%", b"%%")
+        for placeholder, slot in placeholders.items():
+            if document.count(placeholder) != 1:
+                raise ValueError(f"Template {self.template_path} already contains {placeholder.decode()}")
+            document = document.replace(placeholder, slot)
+
+        return document
+
+    def render(self, scenario_name: str, rcp: str, ssp: str, components_bytes: bytes) -> bytes:
+        """Render scenario configuration by filling the document template."""
+        return self._document_template % {
+            b"scenario_name": escape(scenario_name).encode("utf-8"),
+            b"policy_target": escape(self._get_policy_target(ssp, rcp)).encode("utf-8"),
+            b"xmldb_location": escape(f"../output/db_{scenario_name}").encode("utf-8"),
+            b"components": components_bytes,
+        }
+
     def _get_spa_code(self, ssp: str, rcp: str) -> str:
         """Get SPA code for SSP-RCP combination based on actual policy files"""
         # Fixed mapping based on actual policy files
@@ -130,73 +218,17 @@ class BaseTemplateManager:
             }
         return spa_mapping.get(ssp, "0")
 
-    def create_scenario_config(self, scenario_name: str, rcp: str, ssp: str) -> ET.Element:
-        """Create deep copy of template for scenario with RCP and name updates."""
-        scenario_root = copy.deepcopy(self.template_root)
-        
-        # Update scenario name
-        self._update_scenario_name(scenario_root, scenario_name)
-        
-        # Update RCP policy target
-        self._update_policy_target(scenario_root, rcp, ssp)
-        
-        # Update database location only
-        self._update_database_location(scenario_root, scenario_name)
-        
-        return scenario_root
-
-    def _update_scenario_name(self, root: ET.Element, scenario_name: str):
-        """Update scenario name in Strings section."""
-        strings_section = root.find("Strings")
-        if strings_section is not None:
-            for element in strings_section:
-                if element.tag == "Value" and element.get("name") == "scenarioName":
-                    element.text = scenario_name
-                    logger.debug(f"Updated scenario name to: {scenario_name}")
-                    break
-
-    def _update_policy_target(self, root: ET.Element, rcp: str, ssp: str):
-        """Update RCP policy target file reference."""
-        files_section = root.find("Files")
-        if files_section is not None:
-            for element in files_section:
-                if element.tag == "Value" and element.get("name") == "policy-target-file":
-                    spa_code = self._get_spa_code(ssp, rcp)
-                    policy_file = f"../input/policy/policy_target_{rcp}_spa{spa_code}.xml"
-                    element.text = policy_file
-                    logger.debug(f"Updated policy target to: {policy_file}")
-                    break
-
-    def _update_database_location(self, root: ET.Element, scenario_name: str):
-        """Update database location for scenario isolation."""
-        files_section = root.find("Files")
-        if files_section is None:
-            return
+    def _format_policy_target(self, ssp: str, rcp: str) -> str:
+        """Build policy target file path for SSP-RCP combination."""
+        return f"../input/policy/policy_target_{rcp}_spa{self._get_spa_code(ssp, rcp)}.xml"
 
-        for element in files_section:
-            if element.tag == "Value" and element.get("name") == "xmldb-location":
-                element.text = f"../output/db_{scenario_name}"
-                logger.debug(f"Updated xmldb-location to: ../output/db_{scenario_name}")
-                break
-
-    def append_ssp_components(self, root: ET.Element, components: List[Tuple[str, str]]):
-        """Append SSP-specific components to ScenarioComponents section."""
-        scenario_section = root.find("ScenarioComponents")
-        if scenario_section is None:
-            logger.warning("ScenarioComponents section not found in template")
-            return
-
-        # Simply add every component from the SSP file
-        for name, path in components:
-            if name.startswith("COMMENT_") and path.startswith("<!--"):
-                # Add XML comment
-                comment_text = path.replace("<!--", "").replace("-->", "").strip()
-                scenario_section.append(ET.Comment(f" {comment_text} "))
-            else:
-                # Add component
-                ET.SubElement(scenario_section, "Value", name=name).text = path
-
-        logger.info(f"Added {len(components)} SSP components")
+    def _get_policy_target(self, ssp: str, rcp: str) -> str:
+        """Get policy target file path for SSP-RCP combination."""
+        policy_file = self._policy_paths.get((ssp, rcp))
+        if policy_file is None:
+            # Combination outside the configured parameters
+            policy_file = self._format_policy_target(ssp, rcp)
+        return policy_file
 
 # ──────────────────────────────────────────────────────────────────────────────
 # MAIN CONFIGURATION GENERATOR CLASS
@@ -205,136 +237,201 @@ class BaseTemplateManager:
 class GCAMConfigurationGenerator:
     """Main configuration generator."""
 
-    def __init__(self, parameters: ScenarioParameters, ssp_files_directory: str = "./"):
+    def __init__(self, parameters: ScenarioParameters, ssp_files_directory: str = "./",
+                 template_path: str = "configuration_reuse100.xml"):
         self.parameters = parameters
-        self.base_template = BaseTemplateManager()
+        self.base_template = BaseTemplateManager(template_path, parameters.ssps, parameters.rcps)
         self.ssp_extractor = SSPComponentExtractor(ssp_files_directory)
+        # Serialized component block per SSP, shared with worker processes
+        self._ssp_components: Dict[str, bytes] = {}
 
     def generate_scenario_name(self, ssp: str, rcp: str, pr_rate: int, 
                              tech: str, supply: str, allocation: str) -> str:
         """Generate standardized scenario name."""
-        tech_short = "Tech" if tech == "Advanced" else "Basic"
+        tech_short = _TECH_SHORT.get(tech, "Basic")
         supply_short = supply[0]  # L, M, H
-        alloc_short = "Reg" if allocation == "Regulatory" else "Mkt"
+        alloc_short = _ALLOC_SHORT.get(allocation, "Mkt")
         
         return f"{ssp}_{rcp}_{tech_short}_{supply_short}_{alloc_short}_PR{pr_rate}"
 
     def generate_all_configs(self, output_directory: str, 
                            ssp_filter: Optional[List[str]] = None,
-                           use_concurrency: bool = True) -> List[str]:
-        """Generate all scenario configurations."""
+                           use_concurrency: bool = False,
+                           write: bool = True) -> List[str]:
+        """Generate all scenario configurations.
+
+        With write=False (dry run) every scenario is rendered but nothing is written to disk;
+        the returned list holds the paths that would have been written.
+        """
         
         # Create output directory
         output_path = Path(output_directory)
-        output_path.mkdir(parents=True, exist_ok=True)
+        if write:
+            output_path.mkdir(parents=True, exist_ok=True)
+
+        # Parse each SSP file once up front so worker processes receive the serialized blocks
+        axes = self._scenario_axes(ssp_filter)
+        for ssp in axes[0]:
+            self._get_ssp_components_bytes(ssp)
 
-        # Generate scenario combinations
-        scenario_combinations = list(self._generate_combinations(ssp_filter))
+        # Stream scenario combinations; count them without materializing the product
+        scenario_combinations = itertools.product(*axes)
+        total = math.prod(len(axis) for axis in axes)
         
-        logger.info(f"Generating {len(scenario_combinations)} scenario configurations...")
+        logger.info(f"Generating {total} scenario configurations...")
 
-        if use_concurrency and len(scenario_combinations) > 1:
-            generated_files = self._generate_concurrent(scenario_combinations, output_path)
+        # Name each scenario and build its output path once, in the parent
+        tasks = self._generate_tasks(scenario_combinations, output_path)
+
+        if use_concurrency and total > 1:
+            generated_files = self._generate_concurrent(tasks, total, write)
         else:
-            generated_files = self._generate_sequential(scenario_combinations, output_path)
+            generated_files = self._generate_sequential(tasks, total, write)
         
         return generated_files
 
-    def _generate_combinations(self, ssp_filter: Optional[List[str]] = None) -> Iterator[Tuple]:
-        """Generate scenario parameter combinations."""
-        filtered_ssps = self.parameters.ssps
+    def _get_ssp_components_bytes(self, ssp: str) -> bytes:
+        """Get serialized SSP component block, extracting it on first use."""
+        components_bytes = self._ssp_components.get(ssp)
+        if components_bytes is None:
+            components_bytes = self._ssp_components[ssp] = self.ssp_extractor._ssp_components_bytes(ssp)
+        return components_bytes
+
+    def _filter_ssps(self, ssp_filter: Optional[List[str]] = None) -> List[str]:
+        """Restrict configured SSPs to those in the filter, if given."""
         if ssp_filter:
-            filtered_ssps = [ssp for ssp in self.parameters.ssps if ssp in ssp_filter]
+            return [ssp for ssp in self.parameters.ssps if ssp in ssp_filter]
+        return self.parameters.ssps
 
-        return itertools.product(
-            filtered_ssps,
+    def _scenario_axes(self, ssp_filter: Optional[List[str]] = None) -> List[list]:
+        """Get parameter axes whose product is the set of scenarios."""
+        return [
+            self._filter_ssps(ssp_filter),
             self.parameters.rcps,
             self.parameters.pr_adoption_rates,
             self.parameters.technology_levels,
             self.parameters.supply_capacities,
             self.parameters.allocation_regulations
-        )
+        ]
+
+    def _generate_tasks(self, scenarios: Iterator[Tuple], output_path: Path) -> Iterator[Tuple[Tuple, str, str]]:
+        """Pair each scenario with its name and output file path."""
+        output_directory = str(output_path)
+        for scenario_params in scenarios:
+            scenario_name = self.generate_scenario_name(*scenario_params)
+            yield scenario_params, scenario_name, os.path.join(output_directory, f"{scenario_name}.xml")
 
-    def _generate_sequential(self, scenarios: List[Tuple], output_path: Path) -> List[str]:
+    def _generate_sequential(self, tasks: Iterator[Tuple[Tuple, str, str]], total: int,
+                             write: bool = True) -> List[str]:
         """Generate configurations sequentially."""
         generated_files = []
         
-        for i, scenario_params in enumerate(scenarios):
+        for scenario_params, scenario_name, output_file in tasks:
             try:
-                file_path = self._generate_single_scenario(scenario_params, output_path)
-                if file_path:
-                    generated_files.append(file_path)
-                    logger.info(f"Generated ({i+1}/{len(scenarios)}): {Path(file_path).name}")
+                result = self._generate_single_scenario(scenario_params, scenario_name, output_file, write)
+                if result:
+                    generated_files.append(result)
+                    self._log_progress(len(generated_files), total, scenario_name)
             except Exception as e:
                 logger.error(f"Failed to generate scenario {scenario_params}: {e}")
 
         return generated_files
 
-    def _generate_concurrent(self, scenarios: List[Tuple], output_path: Path) -> List[str]:
-        """Generate configurations using thread pool."""
+    def _generate_concurrent(self, tasks: Iterator[Tuple[Tuple, str, str]], total: int,
+                             write: bool = True) -> List[str]:
+        """Generate configurations using process pool."""
         generated_files = []
-        max_workers = min(8, len(scenarios))
-        
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_scenario = {
-                executor.submit(self._generate_single_scenario, scenario_params, output_path): scenario_params
-                for scenario_params in scenarios
-            }
-            
-            completed = 0
-            for future in as_completed(future_to_scenario):
-                scenario_params = future_to_scenario[future]
+        max_workers = min(os.cpu_count() or 1, total)
+        init_args = (self.parameters, self.ssp_extractor.ssp_files_directory,
+                     self.base_template.template_path, self._ssp_components)
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=init_args) as executor:
+            # Submit scenarios in chunks to amortize inter-process overhead
+            future_to_chunk = {}
+            while True:
+                chunk = list(itertools.islice(tasks, _POOL_CHUNK_SIZE))
+                if not chunk:
+                    break
+                future_to_chunk[executor.submit(_generate_chunk_in_worker, chunk, write)] = chunk
+
+            for future in as_completed(future_to_chunk):
+                chunk = future_to_chunk[future]
                 try:
-                    file_path = future.result()
-                    if file_path:
-                        generated_files.append(file_path)
-                        completed += 1
-                        logger.info(f"Generated ({completed}/{len(scenarios)}): {Path(file_path).name}")
+                    results = future.result()
                 except Exception as e:
-                    logger.error(f"Failed to generate scenario {scenario_params}: {e}")
+                    logger.error(f"Failed to generate scenarios {chunk[0][1]} to {chunk[-1][1]}: {e}")
+                    continue
+
+                for file_path, scenario_name in results:
+                    generated_files.append(file_path)
+                    self._log_progress(len(generated_files), total, scenario_name)
 
         return generated_files
 
-    def _generate_single_scenario(self, scenario_params: Tuple, output_path: Path) -> Optional[str]:
-        """Generate a single scenario configuration file."""
-        ssp, rcp, pr_rate, tech, supply, allocation = scenario_params
-        
-        # Generate scenario name
-        scenario_name = self.generate_scenario_name(ssp, rcp, pr_rate, tech, supply, allocation)
+    def _log_progress(self, completed: int, total: int, scenario_name: str):
+        """Log each generated file at DEBUG and a progress line at INFO every _PROGRESS_INTERVAL files and at the end."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Generated ({completed}/{total}): {scenario_name}")
+        if completed % _PROGRESS_INTERVAL == 0 or completed == total:
+            logger.info(f"Generated {completed}/{total} configurations")
 
-        try:
-            # 1. Create base configuration from template
-            config_root = self.base_template.create_scenario_config(scenario_name, rcp, ssp)
+    def _generate_single_scenario(self, scenario_params: Tuple, scenario_name: str, output_file: str,
+                                  write: bool = True) -> Optional[str]:
+        """Generate a single scenario configuration file, returning its path (not written if write is False)."""
+        ssp, rcp = scenario_params[:2]
 
-            # 2. Get SSP-specific components
-            ssp_components = self.ssp_extractor.extract_ssp_components(ssp)
+        try:
+            # 1. Get SSP-specific components, pre-serialized once per SSP
+            components_bytes = self._get_ssp_components_bytes(ssp)
             
-            if not ssp_components:
+            if not components_bytes:
                 logger.error(f"No components extracted for {ssp}")
                 return None
-            
-            # 3. Use SSP components exactly as they are (no substitutions)
-            components_to_add = []
-            for name, path in ssp_components:
-                components_to_add.append((name, path))
 
-            # 4. Append all components to configuration
-            self.base_template.append_ssp_components(config_root, components_to_add)
+            # 2. Splice scenario values and components into the serialized template
+            xml_bytes = self.base_template.render(scenario_name, rcp, ssp, components_bytes)
 
-            # 5. Write configuration file without prettification
-            output_file = output_path / f"{scenario_name}.xml"
-            xml_string = ET.tostring(config_root, encoding="unicode")
+            # 3. Write configuration file without prettification, as one unbuffered write
+            if write:
+                with open(output_file, "wb", buffering=0) as f:
+                    f.write(xml_bytes)
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(xml_string)
-
-            return str(output_file)
+            return output_file
 
         except Exception as e:
             logger.error(f"Error generating scenario {scenario_name}: {e}")
             return None
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# PROCESS POOL WORKERS
+# ──────────────────────────────────────────────────────────────────────────────
+
+# Generator owned by each worker process, created once by _init_worker
+_worker_generator: Optional[GCAMConfigurationGenerator] = None
+
+
+def _init_worker(parameters: ScenarioParameters, ssp_files_directory: str, template_path: str,
+                 ssp_components: Dict[str, bytes]):
+    """Load template once per worker process and seed it with the parent's SSP component blocks."""
+    global _worker_generator
+    _worker_generator = GCAMConfigurationGenerator(parameters, ssp_files_directory, template_path)
+    _worker_generator._ssp_components.update(ssp_components)
+
+
+def _generate_chunk_in_worker(tasks: List[Tuple[Tuple, str, str]], write: bool = True) -> List[Tuple[str, str]]:
+    """Generate a chunk of scenarios using the worker's generator, returning path and name of each success."""
+    results = []
+    for scenario_params, scenario_name, output_file in tasks:
+        try:
+            file_path = _worker_generator._generate_single_scenario(scenario_params, scenario_name, output_file, write)
+            if file_path:
+                results.append((file_path, scenario_name))
+        except Exception as e:
+            logger.error(f"Failed to generate scenario {scenario_params}: {e}")
+    return results
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # RUNNINg entire ensemble
 # ──────────────────────────────────────────────────────────────────────────────
@@ -368,7 +465,7 @@ def run_full_generation():
         generated_files = config_generator.generate_all_configs(
             output_directory="configs_ensemble_complete",
             ssp_filter=None,  # Set to specific SSPs to filter, or None for all
-            use_concurrency=True  # Set to False for sequential processing
+            use_concurrency=False  # Rendering takes microseconds per file; a process pool only adds startup cost
         )
 
         end_time = time.time()